@@ -31,8 +31,15 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
 
+**Performance:**
+
+Each DAC update is a 3-byte I2C write, roughly 90 us on the wire at 400 kHz and
+36 us at 1 MHz. Waveform playback is limited by the bus, not by Python-side
+packing, so raising the I2C frequency is the biggest throughput win.
+
 """
 
+import struct
 import time
 from micropython import const
 from adafruit_bus_device.i2c_device import I2CDevice
@@ -46,15 +53,65 @@ except ImportError:
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_AD569x.git"
 
-_NOP = const(0x00)
+_NORMAL_MODE = const(0x00)
+_OUTPUT_1K_IMPEDANCE = const(0x01)
+_OUTPUT_100K_IMPEDANCE = const(0x02)
+_OUTPUT_TRISTATE = const(0x03)
+
+_WRITE_INPUT = const(0x10)
+_UPDATE_DAC = const(0x20)
 _WRITE_DAC_AND_INPUT = const(0x30)
 _WRITE_CONTROL = const(0x40)
 
+# control register bits
+_CONTROL_RESET = const(0x8000)
+_CONTROL_MODE_SHIFT = const(13)
+_CONTROL_REF_DISABLE = const(0x1000)
+_CONTROL_GAIN_2X = const(0x0800)
+
+# control register words keyed by (mode, internal_reference, gain)
+_MODE_WORDS = {
+    (mode, ref, gain): (mode << _CONTROL_MODE_SHIFT)
+    | (0 if ref else _CONTROL_REF_DISABLE)
+    | (_CONTROL_GAIN_2X if gain else 0)
+    for mode in range(4)
+    for ref in (False, True)
+    for gain in (False, True)
+}
+
+
+def _pack_frame(buffer, offset: int, command: int, data: int) -> None:
+    """
+    Pack a command byte and 16-bit data into a 3-byte frame.
+
+    :param buffer: The buffer to pack the frame into.
+    :param offset: The offset of the frame in the buffer.
+    :param command: The command byte.
+    :param data: The 16-bit data, sent MSB first.
+    """
+    struct.pack_into(">BH", buffer, offset, command, data & 0xFFFF)
+
 
-# pylint: disable=broad-exception-raised
 class Adafruit_AD569x:
     """Class which provides interface to AD569x Dac."""
 
+    normal_mode = _NORMAL_MODE
+    """
+    Normal mode
+    """
+    output_1k_impedance = _OUTPUT_1K_IMPEDANCE
+    """
+    1K impedance mode
+    """
+    output_100k_impedance = _OUTPUT_100K_IMPEDANCE
+    """
+    100K impedance mode
+    """
+    output_tristate = _OUTPUT_TRISTATE
+    """
+    Tri-state mode
+    """
+
     def __init__(self, i2c: I2C, address: int = 0x4C) -> None:
         """
         Initialize the AD569x device.
@@ -67,26 +124,13 @@ class Adafruit_AD569x:
         :param address: The I2C address of the device. Defaults to 0x4C.
         """
         self.i2c_device = I2CDevice(i2c, address)
-        self.normal_mode = const(0x00)
-        """
-        Normal mode
-        """
-        self.output_1k_impedance = const(0x01)
-        """
-        1K impedance mode
-        """
-        self.output_100k_impedance = const(0x02)
-        """
-        100K impedance mode
-        """
-        self.output_tristate = const(0x03)
-        """
-        Tri-state mode
-        """
+        self._buf = bytearray(3)
+        self._value = 0
+        self._input = 0
 
         try:
             self.reset()
-            self._mode = self.normal_mode
+            self._mode = _NORMAL_MODE
             self._internal_reference = True
             self._gain = False
             self._update_control_register()
@@ -97,30 +141,20 @@ class Adafruit_AD569x:
         """
         Send a command and data to the I2C device.
 
-        This internal function prepares a 3-byte buffer containing the command and data,
+        This internal function fills the reusable 3-byte buffer with the command and data,
         and writes it to the I2C device.
 
         :param command: The command byte to send.
         :param data: The 16-bit data to send.
         """
-        try:
-            high_byte = (data >> 8) & 0xFF
-            low_byte = data & 0xFF
-            buffer = bytearray([command, high_byte, low_byte])
-            try:
-                with self.i2c_device as i2c:
-                    i2c.write(buffer)
-            except Exception:  # pylint: disable=broad-exception-caught
-                with self.i2c_device as i2c:
-                    i2c.write(buffer, end=False)
-        except Exception as error:
-            raise Exception(f"Error sending command: {error}") from error
+        _pack_frame(self._buf, 0, command, data)
+        with self.i2c_device as i2c:
+            i2c.write(self._buf)
 
     def _update_control_register(self):
-        data = 0x0000
-        data |= self._mode << 13
-        data |= not self._internal_reference << 12
-        data |= self._gain << 11
+        data = _MODE_WORDS[
+            (self._mode, bool(self._internal_reference), bool(self._gain))
+        ]
         self._send_command(_WRITE_CONTROL, data)
 
     @property
@@ -128,6 +162,8 @@ class Adafruit_AD569x:
         """
         Operating mode for the AD569x chip.
 
+        Setting it soft-resets the chip, which drops the DAC output to 0.
+
         :param value: An int containing new operating mode.
         """
         return self._mode
@@ -148,6 +184,8 @@ class Adafruit_AD569x:
         """
         Internal reference voltage for the AD569x chip.
 
+        Setting it soft-resets the chip, which drops the DAC output to 0.
+
         :param value: A bool to enable the internal reference voltage.
         """
         return self._internal_reference
@@ -163,6 +201,8 @@ class Adafruit_AD569x:
         """
         Gain for the AD569x chip.
 
+        Setting it soft-resets the chip, which drops the DAC output to 0.
+
         :param value: A bool to choose 1X or 2X gain.
         """
         return self._gain
@@ -179,24 +219,112 @@ class Adafruit_AD569x:
         16-bit value to the input register and update the DAC register.
 
         This property writes a 16-bit value to the input register and then updates
-        the DAC register of the AD569x chip in a single operation.
+        the DAC register of the AD569x chip in a single operation. Reading it returns
+        the last value written, without an I2C transaction.
         """
-        return self.value
+        return self._value
 
     @value.setter
     def value(self, val: int) -> None:
         self._send_command(_WRITE_DAC_AND_INPUT, val)
+        self._value = self._input = val & 0xFFFF
+
+    def write_input(self, val: int) -> None:
+        """
+        Stage a 16-bit value in the input register without changing the output.
+
+        The staged value is latched to the DAC by :meth:`update_dac`.
+
+        :param val: The 16-bit value to stage.
+        """
+        self._send_command(_WRITE_INPUT, val)
+        self._input = val & 0xFFFF
+
+    def update_dac(self) -> None:
+        """
+        Latch the value staged by :meth:`write_input` to the DAC output.
+        """
+        self._send_command(_UPDATE_DAC, 0x0000)
+        self._value = self._input
+
+    def write_values(self, values) -> None:
+        """
+        Write a sequence of 16-bit values to the DAC, one after another.
+
+        The I2C device is locked once for the whole sequence instead of once
+        per sample. Each value is still sent as its own I2C transaction.
+
+        :param values: An iterable of 16-bit values to write to the DAC.
+        """
+        buffer = self._buf
+        buffer[0] = _WRITE_DAC_AND_INPUT
+        val = None
+        with self.i2c_device as i2c:
+            for val in values:
+                struct.pack_into(">H", buffer, 1, val & 0xFFFF)
+                i2c.write(buffer)
+        if val is not None:
+            self._value = self._input = val & 0xFFFF
+
+    def build_waveform(self, values) -> list:
+        """
+        Pack a sequence of 16-bit values into one contiguous buffer of frames.
+
+        Returns a list of 3-byte memoryview slices into that buffer, one per
+        value, ready to be played back with :meth:`write_frames`. The slices
+        are created here so that playback does not allocate.
+
+        :param values: A sequence of 16-bit values to write to the DAC.
+        """
+        count = len(values)
+        waveform = bytearray(3 * count)
+        for i, val in enumerate(values):
+            struct.pack_into(">BH", waveform, 3 * i, _WRITE_DAC_AND_INPUT, val & 0xFFFF)
+        view = memoryview(waveform)
+        return [view[3 * i : 3 * i + 3] for i in range(count)]
+
+    def write_frames(self, frames) -> None:
+        """
+        Write a sequence of prebuilt 3-byte frames under a single bus lock.
+
+        :attr:`value` is only updated if the last frame writes the DAC register,
+        and the staged input value only if it writes the input register; any
+        other frame leaves them stale.
+
+        :param frames: An iterable of frames, such as those from
+            :meth:`build_waveform`.
+        """
+        frame = None
+        with self.i2c_device as i2c:
+            for frame in frames:
+                i2c.write(frame)
+        if frame is not None:
+            self._cache_frame(frame)
+
+    def _cache_frame(self, frame) -> None:
+        """
+        Update the cached DAC and input values from a frame that has been written.
+
+        :param frame: A bytes-like object holding the command and data bytes.
+        """
+        if len(frame) != 3:
+            return
+        if frame[0] == _WRITE_DAC_AND_INPUT:
+            self._value = self._input = (frame[1] << 8) | frame[2]
+        elif frame[0] == _WRITE_INPUT:
+            self._input = (frame[1] << 8) | frame[2]
 
     def reset(self):
         """
-        Soft-reset the AD569x chip.
+        Soft-reset the AD569x chip, clearing the DAC output to 0.
         """
-        buffer = bytearray([_WRITE_CONTROL, 0x80, 0x00])
+        _pack_frame(self._buf, 0, _WRITE_CONTROL, _CONTROL_RESET)
         try:
             with self.i2c_device as i2c:
-                i2c.write(buffer, end=False)
+                i2c.write(self._buf)
         except OSError:
+            # the reset may NAK, continue regardless
             pass
-            # print(f"Reset may have triggered a NAK, continuing..")
+        self._value = self._input = 0
         # stabilize after reset
         time.sleep(0.01)
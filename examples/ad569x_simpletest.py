@@ -3,11 +3,13 @@
 
 """Simple demo of writing a sine wave to the AD569x DAC."""
 
+import array
 import math
 import board
 import busio
 import adafruit_ad569x
 
+# throughput is bound by the I2C clock; raising the frequency is optional
 i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
 
 # Initialize AD569x
@@ -15,12 +17,14 @@ dac = adafruit_ad569x.Adafruit_AD569x(i2c)
 
 # length of the sine wave
 LENGTH = 100
-# sine wave values written to the DAC
-value = [
-    int(math.sin(math.pi * 2 * i / LENGTH) * ((2**15) - 1) + 2**15)
-    for i in range(LENGTH)
-]
+# sine wave values written to the DAC, stored as unsigned 16-bit ints
+value = array.array(
+    "H",
+    (
+        int(math.sin(math.pi * 2 * i / LENGTH) * ((2**15) - 1) + 2**15)
+        for i in range(LENGTH)
+    ),
+)
 
 while True:
-    for v in value:
-        dac.value = v
+    dac.write_values(value)
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 agent
+# SPDX-License-Identifier: MIT
+
+"""Play a sine wave on the AD569x DAC from I2C frames precomputed on a host."""
+
+import board
+import busio
+import adafruit_ad569x
+
+# 100-sample sine wave, each sample a ready-to-send 3-byte frame:
+# the write DAC and input register command (0x30) followed by the value, MSB first.
+# Generated on a host with:
+#   bytes(x for i in range(100)
+#         for v in [int(math.sin(math.pi * 2 * i / 100) * 32767 + 32768)]
+#         for x in (0x30, (v >> 8) & 0xFF, v & 0xFF))
+SINE = (
+    b"\x30\x80\x00\x30\x88\x09\x30\x90\x0a\x30\x97\xfb\x30\x9f\xd4\x30\xa7\x8d"
+    b"\x30\xaf\x1e\x30\xb6\x7f\x30\xbd\xa9\x30\xc4\x95\x30\xcb\x3b\x30\xd1\x96"
+    b"\x30\xd7\x9e\x30\xdd\x4e\x30\xe2\x9f\x30\xe7\x8d\x30\xec\x12\x30\xf0\x29"
+    b"\x30\xf3\xd0\x30\xf7\x01\x30\xf9\xbb\x30\xfb\xf9\x30\xfd\xba\x30\xfe\xfc"
+    b"\x30\xff\xbe\x30\xff\xff\x30\xff\xbe\x30\xfe\xfc\x30\xfd\xba\x30\xfb\xf9"
+    b"\x30\xf9\xbb\x30\xf7\x01\x30\xf3\xd0\x30\xf0\x29\x30\xec\x12\x30\xe7\x8d"
+    b"\x30\xe2\x9f\x30\xdd\x4e\x30\xd7\x9e\x30\xd1\x96\x30\xcb\x3b\x30\xc4\x95"
+    b"\x30\xbd\xa9\x30\xb6\x7f\x30\xaf\x1e\x30\xa7\x8d\x30\x9f\xd4\x30\x97\xfb"
+    b"\x30\x90\x0a\x30\x88\x09\x30\x80\x00\x30\x77\xf6\x30\x6f\xf5\x30\x68\x04"
+    b"\x30\x60\x2b\x30\x58\x72\x30\x50\xe1\x30\x49\x80\x30\x42\x56\x30\x3b\x6a"
+    b"\x30\x34\xc4\x30\x2e\x69\x30\x28\x61\x30\x22\xb1\x30\x1d\x60\x30\x18\x72"
+    b"\x30\x13\xed\x30\x0f\xd6\x30\x0c\x2f\x30\x08\xfe\x30\x06\x44\x30\x04\x06"
+    b"\x30\x02\x45\x30\x01\x03\x30\x00\x41\x30\x00\x01\x30\x00\x41\x30\x01\x03"
+    b"\x30\x02\x45\x30\x04\x06\x30\x06\x44\x30\x08\xfe\x30\x0c\x2f\x30\x0f\xd6"
+    b"\x30\x13\xed\x30\x18\x72\x30\x1d\x60\x30\x22\xb1\x30\x28\x61\x30\x2e\x69"
+    b"\x30\x34\xc4\x30\x3b\x6a\x30\x42\x56\x30\x49\x80\x30\x50\xe1\x30\x58\x72"
+    b"\x30\x60\x2b\x30\x68\x04\x30\x6f\xf5\x30\x77\xf6"
+)
+
+i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
+
+# Initialize AD569x
+dac = adafruit_ad569x.Adafruit_AD569x(i2c)
+
+# slice the frames once so playback does not allocate
+view = memoryview(SINE)
+frames = [view[i : i + 3] for i in range(0, len(SINE), 3)]
+
+while True:
+    dac.write_frames(frames)